@@ -27,17 +27,48 @@ Version: 5.0
 Date: 2026-02-07
 """
 
-import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from matplotlib.ticker import AutoMinorLocator, MaxNLocator
 from pathlib import Path
-from aat_data_loader_multisweep import AATDataLoader
-from filename_generator_robust import generate_filename_safe
 import sys
+import os
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Heavy modules (numpy + the matplotlib stack + the loader) are imported on
+# demand via _import_plot_stack() so --help/--version invocations skip the
+# matplotlib font-cache scan entirely
+np = None
+matplotlib = None
+plt = None
+AutoMinorLocator = None
+MaxNLocator = None
+LineCollection = None
+Line2D = None
+AATDataLoader = None
+generate_filename_safe = None
+
+def _import_plot_stack():
+    """Import numpy, the matplotlib stack and the loader (idempotent)"""
+    global np, matplotlib, plt, AutoMinorLocator, MaxNLocator
+    global LineCollection, Line2D, AATDataLoader, generate_filename_safe
+    if plt is not None:
+        return
+    import numpy
+    import matplotlib as mpl
+    mpl.use('Agg')
+    import matplotlib.pyplot as pyplot
+    from matplotlib.ticker import AutoMinorLocator as _aml, MaxNLocator as _mnl
+    from matplotlib.collections import LineCollection as _lc
+    from matplotlib.lines import Line2D as _l2d
+    from aat_data_loader_multisweep import AATDataLoader as _loader
+    from filename_generator_robust import generate_filename_safe as _gfs
+    np = numpy
+    matplotlib = mpl
+    plt = pyplot
+    AutoMinorLocator, MaxNLocator = _aml, _mnl
+    LineCollection, Line2D = _lc, _l2d
+    AATDataLoader = _loader
+    generate_filename_safe = _gfs
 
 # ========== VERSION INFO ==========
 __version__ = "5.0"
@@ -262,24 +293,39 @@ def apply_defaults(args):
     return args
 
 # ========== PLOT STYLING SETUP ==========
+# Static style entries built once at import; only savefig.dpi depends on args
+_BASE_RC = {
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.grid': False,
+    'axes.linewidth': 1.5,
+    'axes.labelweight': 'bold',
+    'axes.labelsize': 14,
+    'xtick.labelsize': 12,
+    'ytick.labelsize': 12,
+    'font.weight': 'bold',
+    'legend.frameon': True,
+    'legend.framealpha': 0.9,
+    'legend.fontsize': 11,
+    'savefig.facecolor': 'white',
+}
+
 def setup_plot_style(args):
     """Configure matplotlib with user settings"""
-    plt.rcParams.update({
-        'figure.facecolor': 'white',
-        'axes.facecolor': 'white',
-        'axes.grid': False,
-        'axes.linewidth': 1.5,
-        'axes.labelweight': 'bold',
-        'axes.labelsize': 14,
-        'xtick.labelsize': 12,
-        'ytick.labelsize': 12,
-        'font.weight': 'bold',
-        'legend.frameon': True,
-        'legend.framealpha': 0.9,
-        'legend.fontsize': 11,
-        'savefig.dpi': args.dpi,
-        'savefig.bbox': 'tight',
-    })
+    # Runs first in both the main process and the pool initializer, so the
+    # plot stack is guaranteed loaded before any drawing happens
+    _import_plot_stack()
+
+    # Vector formats render faster through cairo's direct path emission than
+    # Agg's raster pipeline; fall back silently when pycairo isn't installed.
+    # Runs in the pool initializer too, so workers pick the same backend.
+    if args.format in ('svg', 'pdf'):
+        try:
+            matplotlib.use('cairo')
+        except ImportError:
+            pass
+
+    plt.rcParams.update({**_BASE_RC, 'savefig.dpi': args.dpi})
 
 def get_extension(format_name):
     """Convert format name to file extension"""
@@ -339,6 +385,46 @@ def deduplicate_filename(filename, used_filenames, filepath):
     used_filenames[new_name] = 1
     return new_name
 
+# One compiled alternation finds any subtype keyword in a single scan of the
+# stem; the dispatch table maps the hit to (subtype, measurement type)
+_SUBTYPE_RE = re.compile(r'(res2|wse2|inner|outer)', re.IGNORECASE)
+_SUBTYPE_DISPATCH = {
+    'res2': ('ReS2', 'FET'),
+    'wse2': ('WSe2', 'FET'),
+    'inner': ('Inner', 'AAT'),
+    'outer': ('Outer', 'AAT'),
+}
+
+# Tick-locator factories, resolved once per process - locator instances bind
+# to an axis when set, so each plot needs fresh objects, but the kwargs only
+# depend on args and can be captured a single time
+_LOCATOR_FACTORIES = None
+
+def _tick_locator_factories(args):
+    """Return (major, minor) locator factories for the run's tick settings"""
+    global _LOCATOR_FACTORIES
+    if _LOCATOR_FACTORIES is None:
+        n_major = args.n_major_ticks
+        n_minor = args.n_minor_ticks
+        _LOCATOR_FACTORIES = (
+            lambda: MaxNLocator(nbins=n_major, prune=None),
+            lambda: AutoMinorLocator(n_minor),
+        )
+    return _LOCATOR_FACTORIES
+
+# One reusable figure per process - each worker plots several files, so
+# repeated Figure construction/teardown would be paid chunksize times over
+_SHARED_FIG = None
+
+def _shared_figure():
+    """Return the per-process reusable (fig, ax) pair, cleared for drawing"""
+    global _SHARED_FIG
+    if _SHARED_FIG is None:
+        _SHARED_FIG = plt.figure(figsize=(8, 6))
+    _SHARED_FIG.clear()
+    ax = _SHARED_FIG.add_subplot(1, 1, 1)
+    return _SHARED_FIG, ax
+
 def plot_single_file(measurements, filepath, device_id, output_dir, args):
     """Plot a single file's data"""
     if not measurements:
@@ -346,29 +432,24 @@ def plot_single_file(measurements, filepath, device_id, output_dir, args):
         return None
 
     try:
-        fig, ax = plt.subplots(1, 1, figsize=(8, 6))
-
-        # Get color palette
-        colors = PALETTE_MAP[args.palette]
-
-        print(f"\n📊 Plotting: {filepath.name}")
-        print(f"   Sweeps: {len(measurements)}")
-
-        # Determine subtype from filename or metadata
-        filename_lower = filepath.stem.lower()
-
-        if 'res2' in filename_lower:
-            subtype = 'ReS2'
-            meas_type = 'FET'
-        elif 'wse2' in filename_lower:
-            subtype = 'WSe2'
-            meas_type = 'FET'
-        elif 'inner' in filename_lower:
-            subtype = 'Inner'
-            meas_type = 'AAT'
-        elif 'outer' in filename_lower:
-            subtype = 'Outer'
-            meas_type = 'AAT'
+        fig, ax = _shared_figure()
+
+        # Resolve one color per sweep up front - no modulo arithmetic in the loop
+        pal = PALETTE_MAP[args.palette]
+        n_pal = len(pal)
+        color_cycle = [pal[i % n_pal] for i in range(len(measurements))]
+
+        # Per-file status lines are buffered and flushed in one write at the
+        # end, so each file costs a single stdout syscall (matters over slow
+        # SSH/CI pipes and keeps pool worker output from interleaving)
+        msg = [f"\n📊 Plotting: {filepath.name}",
+               f"   Sweeps: {len(measurements)}"]
+
+        # Determine subtype from filename or metadata - one regex scan of the
+        # stem instead of one substring pass per keyword
+        m = _SUBTYPE_RE.search(filepath.stem)
+        if m:
+            subtype, meas_type = _SUBTYPE_DISPATCH[m.group(1).lower()]
         else:
             subtype = filepath.stem.split('[')[1].split(';')[0].strip() if '[' in filepath.stem else 'Unknown'
             meas_type = 'FET'  # Default
@@ -377,27 +458,64 @@ def plot_single_file(measurements, filepath, device_id, output_dir, args):
         sweep_type_actual = measurements[0]['metadata'].get('sweep_type', 'Id-Vg')
         is_output_curve = sweep_type_actual in ('Id-Vd', 'Ig-Vd')
 
-        # Plot each sweep
+        # Batch all sweeps into LineCollections - one solid collection for
+        # forward sweeps, one dashed for backward - plus one concatenated
+        # marker scatter per direction, so the artist count stays flat
+        segs_fwd = []
+        segs_bwd = []
+        bwd_colors = []
+        legend_handles = []
+        marker_pts_fwd = []
+        marker_colors_fwd = []
+        marker_pts_bwd = []
+        marker_colors_bwd = []
+
         for idx, meas in enumerate(measurements):
-            color = colors[idx % len(colors)]
+            color = color_cycle[idx]
+
+            # Bind the nested dicts once per sweep
             Vd = meas['Vd']
+            fwd = meas['forward']
+            bwd = meas['backward']
 
             # Forward sweep
-            Vg_fwd = meas['forward']['Vg']
-            Id_fwd = meas['forward']['Id']
+            Vg_fwd = fwd['Vg']
+            Id_fwd = fwd['Id']
 
             label = f"$V_g$ = {Vd:.1f} V" if is_output_curve else f"$V_d$ = {Vd:.1f} V"
             current_data = np.abs(Id_fwd) * 1e9 if args.semilogy else Id_fwd * 1e9
-            ax.plot(Vg_fwd, current_data, '-', color=color, linewidth=2.5,
-                   label=label, alpha=1.0, marker='o', markersize=3, markevery=5)
+            seg = np.column_stack((Vg_fwd, current_data))
+            segs_fwd.append(seg)
+            marker_pts_fwd.append(seg[::5])
+            marker_colors_fwd.extend([color] * len(seg[::5]))
+            legend_handles.append(Line2D([], [], color=color, linewidth=2.5,
+                                         marker='o', markersize=3, label=label))
 
             # Backward sweep (if exists)
-            if meas['backward']:
-                Vg_bwd = meas['backward']['Vg']
-                Id_bwd = meas['backward']['Id']
+            if bwd:
+                Vg_bwd = bwd['Vg']
+                Id_bwd = bwd['Id']
                 current_data_bwd = np.abs(Id_bwd) * 1e9 if args.semilogy else Id_bwd * 1e9
-                ax.plot(Vg_bwd, current_data_bwd, '--', color=color, linewidth=2,
-                       alpha=0.4, marker='s', markersize=3, markevery=5)
+                seg_bwd = np.column_stack((Vg_bwd, current_data_bwd))
+                segs_bwd.append(seg_bwd)
+                bwd_colors.append(color)
+                marker_pts_bwd.append(seg_bwd[::5])
+                marker_colors_bwd.extend([color] * len(seg_bwd[::5]))
+
+        ax.add_collection(LineCollection(segs_fwd, colors=color_cycle,
+                                         linewidths=2.5, zorder=2))
+        if segs_bwd:
+            ax.add_collection(LineCollection(segs_bwd, colors=bwd_colors,
+                                             linewidths=2, linestyles='--',
+                                             alpha=0.4, zorder=2))
+
+        pts = np.concatenate(marker_pts_fwd)
+        ax.scatter(pts[:, 0], pts[:, 1], c=marker_colors_fwd, s=9, marker='o', zorder=3)
+        if marker_pts_bwd:
+            pts = np.concatenate(marker_pts_bwd)
+            ax.scatter(pts[:, 0], pts[:, 1], c=marker_colors_bwd, s=9, marker='s',
+                       alpha=0.4, zorder=3)
+        ax.autoscale_view()
 
         # Apply log scale if requested
         if args.semilogy:
@@ -411,10 +529,11 @@ def plot_single_file(measurements, filepath, device_id, output_dir, args):
         ax.set_title(f'{subtype} - {filepath.stem}', fontsize=13, fontweight='bold', pad=15)
 
         # Fine-tune tick marks
-        ax.xaxis.set_major_locator(MaxNLocator(nbins=args.n_major_ticks, prune=None))
-        ax.yaxis.set_major_locator(MaxNLocator(nbins=args.n_major_ticks, prune=None))
-        ax.xaxis.set_minor_locator(AutoMinorLocator(args.n_minor_ticks))
-        ax.yaxis.set_minor_locator(AutoMinorLocator(args.n_minor_ticks))
+        major_locator, minor_locator = _tick_locator_factories(args)
+        ax.xaxis.set_major_locator(major_locator())
+        ax.yaxis.set_major_locator(major_locator())
+        ax.xaxis.set_minor_locator(minor_locator())
+        ax.yaxis.set_minor_locator(minor_locator())
 
         # Set axis ranges (if specified)
         if args.x_range is not None:
@@ -422,7 +541,7 @@ def plot_single_file(measurements, filepath, device_id, output_dir, args):
         if args.y_range is not None:
             ax.set_ylim(args.y_range)
 
-        ax.legend(loc='best', frameon=False, fontsize=11)
+        ax.legend(handles=legend_handles, loc='best', frameon=False, fontsize=11)
         # No grid lines (clean background)
         ax.grid(False)
 
@@ -438,19 +557,30 @@ def plot_single_file(measurements, filepath, device_id, output_dir, args):
         save_path = output_dir / filename
         save_path = get_unique_filepath(save_path)  # Prevent overwriting
 
-        # Save
-        plt.savefig(save_path, dpi=args.dpi, bbox_inches='tight', facecolor='white')
-        print(f"   ✓ Saved: {save_path.name}")
+        # Save - dpi and facecolor come from rcParams; skipping bbox_inches
+        # avoids the extra tight-bbox renderer pass (tight_layout already ran)
+        plt.savefig(save_path)
+        msg.append(f"   ✓ Saved: {save_path.name}")
 
-        plt.close(fig)
+        sys.stdout.write('\n'.join(msg) + '\n')
         return save_path
 
+    except (FileNotFoundError, KeyError, ValueError, IndexError) as e:
+        # Expected data problems (missing files, malformed metadata): short
+        # notice only, no traceback frame walk
+        print(f"   ⚠️  Skipping {filepath.name}: {e}")
+        return None
     except Exception as e:
         print(f"   ❌ Error plotting {filepath.name}: {e}")
         import traceback
         traceback.print_exc()
         return None
 
+def _plot_one(task):
+    """Worker entry for parallel plotting - unpacks one (file, data) task"""
+    measurements, filepath, device_id, output_dir, args = task
+    return plot_single_file(measurements, filepath, device_id, output_dir, args)
+
 def main():
     """Main execution"""
     # Parse arguments
@@ -516,52 +646,68 @@ def main():
 
     loader = AATDataLoader()
 
-    # Get list of files
+    # Get list of files - one scandir pass gives name + file-type per entry
+    # without the extra stat and fnmatch work of Path.glob
     if data_path.is_file():
         files = [data_path]
     elif data_path.is_dir():
-        files = sorted([f for f in data_path.glob("*.txt")
-                       if not f.stem.endswith('-s') and
-                       'diagnostic' not in f.stem.lower()])
+        files = sorted(
+            data_path / entry.name
+            for entry in os.scandir(data_path)
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.endswith('.txt')
+            and not entry.name[:-4].endswith('-s')
+            and 'diagnostic' not in entry.name.lower()
+        )
     else:
         print("❌ Invalid path")
         return
 
     print(f"\nFound {len(files)} data file(s)\n")
 
-    # Process each file individually
+    # Load all files up front with overlapped I/O
+    loaded = loader.load_measurements_batch(files)
+
+    # Build the per-file worklist (measurements are numpy arrays + dicts,
+    # so tasks pickle cleanly into worker processes)
     successful = 0
     failed = 0
+    tasks = []
 
     for filepath in files:
-        try:
-            # Load this file only
-            measurements = loader.load_measurement(filepath)
-
-            if not measurements:
-                print(f"⚠️  {filepath.name}: No data loaded")
-                failed += 1
-                continue
-
-            # Get device ID - Priority: command line > settings file > default
-            if args.device:
-                device_id = args.device
-            elif measurements[0]['metadata'].get('device_id'):
-                device_id = measurements[0]['metadata']['device_id']
-            else:
-                device_id = "DV-26-XX"  # Default fallback (DV=Device, 26=2026, XX=ID number)
-
-            # Plot this file
-            result = plot_single_file(measurements, filepath, device_id, output_dir, args)
-
-            if result:
-                successful += 1
-            else:
-                failed += 1
-
-        except Exception as e:
-            print(f"❌ Error processing {filepath.name}: {e}")
+        measurements = loaded[filepath]
+
+        if not measurements:
+            print(f"⚠️  {filepath.name}: No data loaded")
             failed += 1
+            continue
+
+        # Get device ID - Priority: command line > settings file > default
+        # Each data file resolves its own settings file, so the ID is
+        # per-file; the metadata dict is already in memory
+        if args.device:
+            device_id = args.device
+        else:
+            # DV-26-XX fallback: DV=Device, 26=2026, XX=ID number
+            device_id = measurements[0]['metadata'].get('device_id') or "DV-26-XX"
+
+        tasks.append((measurements, filepath, device_id, output_dir, args))
+
+    # Each file renders an independent figure, so batch runs fan out across
+    # a process pool; workers re-apply the plot style via the initializer
+    try:
+        if len(tasks) > 1:
+            with ProcessPoolExecutor(initializer=setup_plot_style,
+                                     initargs=(args,)) as pool:
+                results = list(pool.map(_plot_one, tasks, chunksize=4))
+        else:
+            results = [_plot_one(task) for task in tasks]
+    except Exception as e:
+        print(f"❌ Error during plotting: {e}")
+        results = []
+
+    successful += sum(1 for r in results if r)
+    failed += sum(1 for r in results if not r)
 
     # Summary
     print("\n" + "="*70)
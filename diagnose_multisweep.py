@@ -6,26 +6,60 @@ Check how your data file is split into separate Vd sweeps
 
 Usage:
     python diagnose_multisweep.py /path/to/file.txt
-    python diagnose_multisweep.py /path/to/directory/
+    python diagnose_multisweep.py /path/to/directory/ [--yes] [--parallel N]
 """
 
+import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support
 from pathlib import Path
 
-# Set non-interactive backend BEFORE importing pyplot
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive: saves files without displaying
-
 from aat_data_loader_multisweep import AATDataLoader
 
+
+def _load_one(filepath):
+    """
+    Parse one file in a worker process
+
+    Each worker builds its own loader (loaders are not picklable) and
+    returns a compact per-sweep summary instead of the full arrays, so
+    only small tuples cross the process boundary.
+    """
+    loader = AATDataLoader()
+    measurements = loader.load_measurement(filepath)
+    if not measurements:
+        return filepath, None
+    return filepath, [(m['Vd'], len(m['Vg']), m['backward'] is not None)
+                      for m in measurements]
+
+
+def _diagnose_one(filepath):
+    """Render one diagnostic plot in a worker process"""
+    AATDataLoader().diagnose_file(filepath, save_plot=True)
+    return filepath
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage:")
-        print("  python diagnose_multisweep.py /path/to/file.txt")
-        print("  python diagnose_multisweep.py /path/to/directory/")
-        return
-    
-    target = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(
+        description='Check how multi-sweep data files are split into separate Vd sweeps')
+    parser.add_argument('target',
+                        help='Data file or directory to diagnose')
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='Create diagnostic plots without prompting (for scripts/CI)')
+    parser.add_argument('--parallel', type=int, default=None, metavar='N',
+                        help='Worker processes for batch mode (default: CPU count)')
+    args = parser.parse_args()
+
+    # Set non-interactive backend BEFORE pyplot is first imported. Deferred
+    # to after argument validation so the usage/error path doesn't pay the
+    # matplotlib cold-import cost
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive: saves files without displaying
+
+    workers = args.parallel or os.cpu_count()
+    target = Path(args.target)
     loader = AATDataLoader()
     
     if target.is_file():
@@ -41,40 +75,75 @@ def main():
         print("BATCH DIAGNOSTIC - MULTI-SWEEP FILES")
         print("="*70)
         
-        files = [f for f in target.glob("*.txt") 
-                if not f.stem.endswith('-s') and 
-                'diagnostic' not in f.stem.lower()]
-        
+        # scandir filters on raw entry names - no per-entry stat or fnmatch
+        # the way Path.glob + .stem chains would cost on big directories
+        with os.scandir(target) as it:
+            files = [Path(entry.path) for entry in it
+                     if entry.name.endswith('.txt') and
+                     not entry.name[:-4].endswith('-s') and
+                     'diagnostic' not in entry.name.lower()]
+
         print(f"\nFound {len(files)} data files\n")
-        
-        for filepath in sorted(files):
+
+        files = sorted(files)
+
+        # Each file parses independently, so fan the batch out across
+        # cores; results come back in order and print after the join. The
+        # in-process path keeps the parsed measurements so a later plot
+        # pass does not parse the same files again
+        parsed = {}
+        if len(files) > 1 and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_load_one, files))
+        else:
+            results = []
+            for filepath in files:
+                measurements = loader.load_measurement(filepath)
+                parsed[filepath] = measurements
+                if measurements:
+                    results.append((filepath,
+                                    [(m['Vd'], len(m['Vg']), m['backward'] is not None)
+                                     for m in measurements]))
+                else:
+                    results.append((filepath, None))
+
+        for filepath, summary in results:
             print(f"\n{'='*70}")
             print(f"File: {filepath.name}")
             print(f"{'='*70}")
-            
-            measurements = loader.load_measurement(filepath)
-            
-            if measurements:
-                print(f"✓ {len(measurements)} sweep(s) detected:")
-                for idx, meas in enumerate(measurements, 1):
-                    bidir = "bidirectional" if meas['backward'] else "unidirectional"
-                    print(f"  {idx}. Vd = {meas['Vd']:.2f} V ({bidir}, {len(meas['Vg'])} points)")
+
+            if summary:
+                print(f"✓ {len(summary)} sweep(s) detected:")
+                for idx, (vd, npoints, has_backward) in enumerate(summary, 1):
+                    bidir = "bidirectional" if has_backward else "unidirectional"
+                    print(f"  {idx}. Vd = {vd:.2f} V ({bidir}, {npoints} points)")
             else:
                 print(f"❌ Failed to load")
-        
-        # Offer to create diagnostic plots
+
+        # Offer to create diagnostic plots; --yes skips the prompt so the
+        # script can run unattended
         print("\n" + "="*70)
-        response = input("\nCreate diagnostic plots for all files? (y/n): ")
-        
+        if args.yes:
+            response = 'y'
+        else:
+            response = input("\nCreate diagnostic plots for all files? (y/n): ")
+
         if response.lower() == 'y':
             print("\nGenerating diagnostic plots...")
-            for filepath in files:
-                print(f"\n  Processing: {filepath.name}")
-                loader.diagnose_file(filepath, save_plot=True)
-            
+            if len(files) > 1 and workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for filepath in pool.map(_diagnose_one, files):
+                        print(f"  ✓ {filepath.name}")
+            else:
+                for filepath in files:
+                    print(f"\n  Processing: {filepath.name}")
+                    loader.diagnose_file(filepath, save_plot=True,
+                                         measurements=parsed.get(filepath))
+
             print("\n✓ All diagnostic plots saved!")
     else:
         print(f"❌ Error: {target} not found!")
 
 if __name__ == "__main__":
+    freeze_support()
     main()
@@ -13,25 +13,84 @@ Features:
 
 from pathlib import Path
 import numpy as np
+import os
+import re
 import sys
 
-def validate_measurement_type(meas_type):
+# One compiled alternation + lookup table shared by all three generators -
+# replaces the duplicated eight-branch substring ladders
+_SWEEP_RE = re.compile(r'id[-_]?vg|id[-_]?vd|ig[-_]?vg|ig[-_]?vd', re.IGNORECASE)
+_SWEEP_MAP = {'idvg': 'Id-Vg', 'idvd': 'Id-Vd', 'igvg': 'Ig-Vg', 'igvd': 'Ig-Vd'}
+
+def _detect_sweep_from_name(filepath):
+    """Detect the sweep type from a data-file path; None if not recognizable"""
+    # os.fspath hands back the raw path string - the IGNORECASE regex scans
+    # it directly, with no lowercased copy of the whole path
+    match = _SWEEP_RE.search(os.fspath(filepath))
+    if not match:
+        return None
+    key = match.group(0).lower().replace('-', '').replace('_', '')
+    return _SWEEP_MAP[key]
+
+# Filename cleanup table - one C-level translate pass instead of two
+# chained .replace() traversals
+_FN_TRANS = str.maketrans({' ': '_', ':': '-'})
+
+def _vg_range(measurements):
+    """
+    Vg range of the first sweep
+
+    The loader marks each sweep it verified as a single ramp at split
+    time; for those the endpoints give the range in O(1). Anything else
+    (short up-down traces, failed trend detection, dicts built outside
+    the loader) gets the full min/max scan.
+    """
+    first = measurements[0]
+    vg = first['forward']['Vg']
+    if first.get('monotonic', False):
+        a, b = float(vg[0]), float(vg[-1])
+        return (a, b) if a <= b else (b, a)
+    return float(vg.min()), float(vg.max())
+
+# Shared component formatters - one implementation of the range/count
+# wording instead of a copy per generator
+def _fmt_sweep_count(n):
+    """'1sweep' / '3sweeps' component"""
+    return f"{n}sweep" if n == 1 else f"{n}sweeps"
+
+def _fmt_param(label, lo, hi, collapse=True):
+    """'Vd-1.0to1.0V' range component, collapsed to 'Vd-1.0V' when constant"""
+    if collapse and abs(lo - hi) < 0.01:
+        return f"{label}{lo:.1f}V"
+    return f"{label}{lo:.1f}to{hi:.1f}V"
+
+def _fmt_sweep_axis(label, lo, hi):
+    """'Vg-8to0V' swept-axis component (integer volts)"""
+    return f"{label}{lo:.0f}to{hi:.0f}V"
+
+def validate_measurement_type(meas_type, interactive=True):
     """Validate measurement type"""
     valid = ['FET', 'AAT', 'fet', 'aat']
     if meas_type not in valid:
         print(f"⚠️  Warning: '{meas_type}' is not a standard measurement type")
         print(f"   Expected: FET or AAT")
+        if not interactive:
+            # No TTY in batch runs - warn and keep the caller's value
+            return meas_type.upper()
         response = input(f"   Use '{meas_type}' anyway? (y/n): ").strip().lower()
         if response != 'y':
             return None
     return meas_type.upper()
 
-def validate_sweep_type(sweep_type):
+def validate_sweep_type(sweep_type, interactive=True):
     """Validate sweep type"""
     valid = ['Id-Vg', 'Id-Vd', 'Ig-Vg', 'Ig-Vd', 'C-V', 'G-V']
     if sweep_type not in valid:
         print(f"⚠️  Warning: '{sweep_type}' is not a standard sweep type")
         print(f"   Expected: {', '.join(valid)}")
+        if not interactive:
+            # No TTY in batch runs - warn and keep the caller's value
+            return sweep_type
         response = input(f"   Use '{sweep_type}' anyway? (y/n): ").strip().lower()
         if response != 'y':
             return None
@@ -77,34 +136,28 @@ def generate_filename_safe(measurements, measurement_type, subtype, device_id,
                 return manual + extension
         return None
     
+    # Bind the metadata dict once - each chained .get('metadata', {})
+    # lookup allocates a throwaway empty dict and probes twice
+    md = measurements[0].get('metadata') or {}
+
     # AUTO-DETECT SWEEP TYPE - Try metadata first, then filename
     detected_sweep_type = None
     metadata_source = None
-    
+
     # Priority 1: Check if sweep_type is in metadata (already detected by data loader)
-    if measurements[0].get('metadata', {}).get('sweep_type'):
-        detected_sweep_type = measurements[0]['metadata']['sweep_type']
-        metadata_source = measurements[0].get('metadata', {}).get('metadata_source', 'unknown')
-        
+    if md.get('sweep_type'):
+        detected_sweep_type = md['sweep_type']
+        metadata_source = md.get('metadata_source', 'unknown')
+
         if verbose:
             source_label = "settings file" if metadata_source == 'settings_file' else "filename"
             print(f"✓ Sweep type from {source_label}: {detected_sweep_type}")
-    
+
     # Priority 2: Parse from filepath if not in metadata
-    elif measurements[0].get('metadata', {}).get('filepath'):
-        filepath = measurements[0]['metadata']['filepath']
-        filename_lower = str(filepath).lower()
-        
+    elif md.get('filepath'):
         # Check for sweep type patterns in filename
-        if 'id-vg' in filename_lower or 'idvg' in filename_lower:
-            detected_sweep_type = 'Id-Vg'
-        elif 'id-vd' in filename_lower or 'idvd' in filename_lower:
-            detected_sweep_type = 'Id-Vd'
-        elif 'ig-vg' in filename_lower or 'igvg' in filename_lower:
-            detected_sweep_type = 'Ig-Vg'
-        elif 'ig-vd' in filename_lower or 'igvd' in filename_lower:
-            detected_sweep_type = 'Ig-Vd'
-        
+        detected_sweep_type = _detect_sweep_from_name(md['filepath'])
+
         if detected_sweep_type:
             metadata_source = 'filename'
             if verbose:
@@ -121,28 +174,29 @@ def generate_filename_safe(measurements, measurement_type, subtype, device_id,
         print("FILENAME GENERATION - VALIDATION")
         print("="*70)
     
-    measurement_type = validate_measurement_type(measurement_type)
+    measurement_type = validate_measurement_type(measurement_type, interactive=interactive)
     if measurement_type is None:
         return None
-    
-    sweep_type = validate_sweep_type(sweep_type)
+
+    sweep_type = validate_sweep_type(sweep_type, interactive=interactive)
     if sweep_type is None:
         return None
     
     # Extract parameters from measurements
     try:
-        vd_values = [m['Vd'] for m in measurements]
-        vd_min = min(vd_values)
-        vd_max = max(vd_values)
+        # One C-level pass over a packed array instead of two
+        # Python-level min/max scans of a temporary list
+        vd_arr = np.fromiter((m['Vd'] for m in measurements),
+                             dtype=np.float64, count=len(measurements))
+        vd_min = float(vd_arr.min())
+        vd_max = float(vd_arr.max())
         num_sweeps = len(measurements)
         
-        # Get Vg range from first measurement
-        vg = measurements[0]['forward']['Vg']
-        vg_min = vg.min()
-        vg_max = vg.max()
+        # Get Vg range from first measurement (endpoints - sweeps are monotonic)
+        vg_min, vg_max = _vg_range(measurements)
         
         # Try to get date from first measurement
-        date = measurements[0].get('metadata', {}).get('date', None)
+        date = md.get('date')
         
         is_output = sweep_type in ('Id-Vd', 'Ig-Vd')
         if verbose:
@@ -172,7 +226,9 @@ def generate_filename_safe(measurements, measurement_type, subtype, device_id,
         if interactive:
             print("\n⚠️  Automatic detection failed. Manual input required.")
             return manual_filename_input(extension)
-        return None
+        # Non-interactive callers get the real error instead of a hidden
+        # TTY prompt or a silent None
+        raise
     
     # Build filename
     components = []
@@ -187,23 +243,17 @@ def generate_filename_safe(measurements, measurement_type, subtype, device_id,
     components.append(sweep_type)
     
     # 4. Number of sweeps
-    sweep_word = "sweep" if num_sweeps == 1 else "sweeps"
-    components.append(f"{num_sweeps}{sweep_word}")
-    
+    components.append(_fmt_sweep_count(num_sweeps))
+
     # 5 & 6. Parameter and sweep ranges (labels depend on sweep direction)
     if is_output:
         # Id-Vd d(Vg): 'Vd' key holds Vg parameter steps, 'forward.Vg' holds Vd sweep
-        param_str = f"Vg{vd_min:.1f}to{vd_max:.1f}V"
-        sweep_str = f"Vd{vg_min:.0f}to{vg_max:.0f}V"
+        components.append(_fmt_param("Vg", vd_min, vd_max, collapse=False))
+        components.append(_fmt_sweep_axis("Vd", vg_min, vg_max))
     else:
         # Id-Vg (transfer): standard labeling
-        if abs(vd_min - vd_max) < 0.01:
-            param_str = f"Vd{vd_min:.1f}V"
-        else:
-            param_str = f"Vd{vd_min:.1f}to{vd_max:.1f}V"
-        sweep_str = f"Vg{vg_min:.0f}to{vg_max:.0f}V"
-    components.append(param_str)
-    components.append(sweep_str)
+        components.append(_fmt_param("Vd", vd_min, vd_max))
+        components.append(_fmt_sweep_axis("Vg", vg_min, vg_max))
     
     # 7. Device ID
     components.append(device_id)
@@ -213,8 +263,7 @@ def generate_filename_safe(measurements, measurement_type, subtype, device_id,
         components.append(date)
     
     # Join and clean
-    filename = "_".join(components) + extension
-    filename = filename.replace(" ", "_").replace(":", "-")
+    filename = ("_".join(components) + extension).translate(_FN_TRANS)
     
     # Confirmation
     if verbose or interactive:
@@ -287,12 +336,11 @@ def manual_filename_input(extension=".png"):
     date = input("  7. Date (YYYY-MM-DD) [optional]: ").strip()
     
     # Build filename
-    sweep_word = "sweep" if num_sweeps == 1 else "sweeps"
     components = [
         subtype,
         meas_type,
         sweep_type,
-        f"{num_sweeps}{sweep_word}",
+        _fmt_sweep_count(num_sweeps),
         vd_range,
         device_id
     ]
@@ -300,8 +348,7 @@ def manual_filename_input(extension=".png"):
     if date:
         components.append(date)
     
-    filename = "_".join(components) + extension
-    filename = filename.replace(" ", "_").replace(":", "-")
+    filename = ("_".join(components) + extension).translate(_FN_TRANS)
     
     print(f"\n📝 Generated filename: {filename}")
     confirm = input("   Confirm? (y/n): ").strip().lower()
@@ -321,44 +368,29 @@ def generate_filename_compact(measurements, measurement_type, subtype, device_id
     """
     if not measurements:
         return f"{subtype}_{measurement_type}_{device_id}{extension}"
-    
+
     # Auto-detect sweep type from metadata (priority 1) or filename (priority 2)
-    if measurements[0].get('metadata', {}).get('sweep_type'):
-        sweep_type = measurements[0]['metadata']['sweep_type']
-    elif measurements[0].get('metadata', {}).get('filepath'):
-        filepath = measurements[0]['metadata']['filepath']
-        filename_lower = str(filepath).lower()
-        
-        if 'id-vg' in filename_lower or 'idvg' in filename_lower:
-            sweep_type = 'Id-Vg'
-        elif 'id-vd' in filename_lower or 'idvd' in filename_lower:
-            sweep_type = 'Id-Vd'
-        elif 'ig-vg' in filename_lower or 'igvg' in filename_lower:
-            sweep_type = 'Ig-Vg'
-        elif 'ig-vd' in filename_lower or 'igvd' in filename_lower:
-            sweep_type = 'Ig-Vd'
-    
-    vd_values = [m['Vd'] for m in measurements]
-    vd_min = min(vd_values)
-    vd_max = max(vd_values)
-    
-    # Get Vg range
-    vg = measurements[0]['forward']['Vg']
-    vg_min = vg.min()
-    vg_max = vg.max()
-    
-    if abs(vd_min - vd_max) < 0.01:
-        vd_str = f"Vd{vd_min:.1f}V"
-    else:
-        vd_str = f"Vd{vd_min:.1f}to{vd_max:.1f}V"
-    
-    vg_str = f"Vg{vg_min:.0f}to{vg_max:.0f}V"
-    
+    md = measurements[0].get('metadata') or {}
+    if md.get('sweep_type'):
+        sweep_type = md['sweep_type']
+    elif md.get('filepath'):
+        sweep_type = _detect_sweep_from_name(md['filepath']) or sweep_type
+    
+    # One C-level pass over a packed array instead of two
+    # Python-level min/max scans of a temporary list
+    vd_arr = np.fromiter((m['Vd'] for m in measurements),
+                         dtype=np.float64, count=len(measurements))
+    vd_min = float(vd_arr.min())
+    vd_max = float(vd_arr.max())
+    
+    # Get Vg range (endpoints - sweeps are monotonic)
+    vg_min, vg_max = _vg_range(measurements)
+    
+    vd_str = _fmt_param("Vd", vd_min, vd_max)
+    vg_str = _fmt_sweep_axis("Vg", vg_min, vg_max)
+
     components = [subtype, measurement_type, sweep_type, vd_str, vg_str, device_id]
-    filename = "_".join(components) + extension
-    filename = filename.replace(" ", "_").replace(":", "-")
-    
-    return filename
+    return ("_".join(components) + extension).translate(_FN_TRANS)
 
 def generate_filename_detailed(measurements, measurement_type, subtype, device_id,
                                sweep_type="Id-Vg", extension=".png"):
@@ -369,40 +401,33 @@ def generate_filename_detailed(measurements, measurement_type, subtype, device_i
     """
     if not measurements:
         return f"{subtype}_{measurement_type}_{device_id}{extension}"
-    
+
     # Auto-detect sweep type from metadata (priority 1) or filename (priority 2)
-    if measurements[0].get('metadata', {}).get('sweep_type'):
-        sweep_type = measurements[0]['metadata']['sweep_type']
-    elif measurements[0].get('metadata', {}).get('filepath'):
-        filepath = measurements[0]['metadata']['filepath']
-        filename_lower = str(filepath).lower()
-        
-        if 'id-vg' in filename_lower or 'idvg' in filename_lower:
-            sweep_type = 'Id-Vg'
-        elif 'id-vd' in filename_lower or 'idvd' in filename_lower:
-            sweep_type = 'Id-Vd'
-        elif 'ig-vg' in filename_lower or 'igvg' in filename_lower:
-            sweep_type = 'Ig-Vg'
-        elif 'ig-vd' in filename_lower or 'igvd' in filename_lower:
-            sweep_type = 'Ig-Vd'
+    md = measurements[0].get('metadata') or {}
+    if md.get('sweep_type'):
+        sweep_type = md['sweep_type']
+    elif md.get('filepath'):
+        sweep_type = _detect_sweep_from_name(md['filepath']) or sweep_type
     
     # Extract all parameters
-    vd_values = [m['Vd'] for m in measurements]
-    vd_min = min(vd_values)
-    vd_max = max(vd_values)
+    # One C-level pass over a packed array instead of two
+    # Python-level min/max scans of a temporary list
+    vd_arr = np.fromiter((m['Vd'] for m in measurements),
+                         dtype=np.float64, count=len(measurements))
+    vd_min = float(vd_arr.min())
+    vd_max = float(vd_arr.max())
     num_sweeps = len(measurements)
     
-    # Vg range from first measurement
-    vg = measurements[0]['forward']['Vg']
-    vg_min = vg.min()
-    vg_max = vg.max()
+    # Vg range from first measurement (endpoints - sweeps are monotonic)
+    vg_min, vg_max = _vg_range(measurements)
     
     # Average points
-    avg_points = int(np.mean([len(m['forward']['Vg']) for m in measurements]))
+    avg_points = int(np.fromiter((len(m['forward']['Vg']) for m in measurements),
+                                 dtype=np.int64, count=len(measurements)).mean())
     
     # Date and time
-    date = measurements[0].get('metadata', {}).get('date', None)
-    time = measurements[0].get('metadata', {}).get('time', None)
+    date = md.get('date')
+    time = md.get('time')
     
     # Build components
     components = []
@@ -410,15 +435,9 @@ def generate_filename_detailed(measurements, measurement_type, subtype, device_i
     components.append(measurement_type)
     components.append(sweep_type)
     
-    sweep_word = "sweep" if num_sweeps == 1 else "sweeps"
-    components.append(f"{num_sweeps}{sweep_word}")
-    
-    if abs(vd_min - vd_max) < 0.01:
-        components.append(f"Vd{vd_min:.1f}V")
-    else:
-        components.append(f"Vd{vd_min:.1f}to{vd_max:.1f}V")
-    
-    components.append(f"Vg{vg_min:.0f}to{vg_max:.0f}V")
+    components.append(_fmt_sweep_count(num_sweeps))
+    components.append(_fmt_param("Vd", vd_min, vd_max))
+    components.append(_fmt_sweep_axis("Vg", vg_min, vg_max))
     components.append(f"{avg_points}pts")
     components.append(device_id)
     
@@ -427,11 +446,8 @@ def generate_filename_detailed(measurements, measurement_type, subtype, device_i
     if time:
         time_short = time[:5].replace(":", "-")
         components.append(time_short)
-    
-    filename = "_".join(components) + extension
-    filename = filename.replace(" ", "_").replace(":", "-")
-    
-    return filename
+
+    return ("_".join(components) + extension).translate(_FN_TRANS)
 
 # Alias for backward compatibility
 generate_filename = generate_filename_safe